@@ -7,27 +7,39 @@ Tests for Rules Engine
 """
 
 import pytest
+import functools
 import json
+import os
+from collections import defaultdict
 from unittest.mock import Mock, patch
 import sys
-sys.path.append(str(Path(__file__).parent.parent / 'governance-rules-engine'))
 
 # Mock Go imports for testing
 class MockRulesEngine:
     def __init__(self):
         self.policies = {}
+        self.by_target = defaultdict(list)
     
     def register_policy(self, policy):
-        self.policies[policy['id']] = policy
+        self.policies[sys.intern(policy['id'])] = policy
+        self.by_target[sys.intern(policy.get('targetType', '*'))].append(policy)
         return True
     
     def evaluate(self, resource):
+        resource_type = sys.intern(resource['type'])
+        matching = self.by_target.get(resource_type, []) + self.by_target.get('*', [])
         return {
             "passed": True,
-            "violations": []
+            "violations": [],
+            "evaluated": [policy['id'] for policy in matching]
         }
 
 
+def _evaluate(engine, resource):
+    """Module-level entry point so worker processes can unpickle the call."""
+    return engine.evaluate(resource)
+
+
 class TestRulesEngine:
     def test_policy_registration(self):
         """Test policy registration."""
@@ -88,11 +100,12 @@ class TestRulesEngine:
             "properties": {}
         }
         
-        # In real implementation, would check if policy was evaluated
         result = engine.evaluate(resource)
         assert isinstance(result, dict)
+        assert ("s3-policy" in result["evaluated"]) == expected_match
 
 
+@pytest.mark.xdist_group("perf")
 class TestPerformance:
     def test_concurrent_evaluation(self):
         """Test concurrent evaluation of multiple resources."""
@@ -122,9 +135,8 @@ class TestPerformance:
         # Evaluate concurrently
         start_time = time.time()
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [executor.submit(engine.evaluate, resource) for resource in resources]
-            results = [f.result() for f in concurrent.futures.as_completed(futures)]
+        with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(executor.map(functools.partial(_evaluate, engine), resources, chunksize=10))
         
         end_time = time.time()
         